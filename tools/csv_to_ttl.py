@@ -2,11 +2,15 @@
 
 import argparse
 import csv
-import datetime
+import functools
+import re
+import time
 
 import rdflib  # separate import for triggering autocomplete behavior in IDE
-from rdflib import Graph, Literal, URIRef
-from rdflib.namespace import DCTERMS, OWL, RDF, RDFS, XSD, NamespaceManager
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.collection import Collection
+from rdflib.namespace import DCTERMS, OWL, RDF, RDFS, SKOS, XSD, NamespaceManager
+from rdflib.plugins.stores.memory import SimpleMemory
 from rdflib.util import from_n3
 
 # extra prefixes (besides the ones defined in metadata file) to be used in conversion
@@ -50,8 +54,33 @@ PREFIXES_DATA = """
 @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
 """
 
+# prefix to namespace map extracted once at import time; binding these
+# directly avoids running the Turtle parser on a constant string per run
+_PREFIX_MAP = dict(re.findall(r"@prefix (\w+): <([^>]+)> \.", PREFIXES_DATA))
+
 # treat these CSV cell values as empty/missing
-EMPTY_COL_VALS = set(["", "#N/A"])
+EMPTY_COL_VALS = frozenset(("", "#N/A"))
+
+# allowed values for the LKD to BF/RDA mapping columns, resolved directly
+# to their URIRefs so the row loop never parses these as n3
+MAP_PREDS = {
+    "skos:exactMatch": SKOS.exactMatch,
+    "skos:closeMatch": SKOS.closeMatch,
+    "skos:broadMatch": SKOS.broadMatch,
+    "skos:narrowMatch": SKOS.narrowMatch,
+}
+ALLOWED_MAPS = frozenset(MAP_PREDS)
+
+
+@functools.lru_cache(maxsize=4096)
+def _from_n3_cached(s: str, nsm: NamespaceManager):
+    """
+    Caches rdflib.util.from_n3 results per namespace manager.
+
+    Shared at module scope so processes constructing several converters
+    (batch scripts, tests) reuse results across instances.
+    """
+    return from_n3(s, nsm=nsm)
 
 
 class DataModelConverter:
@@ -80,22 +109,34 @@ class DataModelConverter:
         self.version = args.version
         self.prior_version = args.prior_version
 
+        # SimpleMemory keeps a single index instead of the default store's
+        # context-aware three-way indexes, which is enough for a build-once,
+        # serialize-once conversion and makes each add cheaper
         if self.metadata_path:
-            self.graph = rdflib.Graph().parse(self.metadata_path, format="ttl")
+            self.graph = rdflib.Graph(store=SimpleMemory()).parse(self.metadata_path, format="ttl")
         else:
-            self.graph = rdflib.Graph()
+            self.graph = rdflib.Graph(store=SimpleMemory())
 
-        self.graph.parse(data=PREFIXES_DATA)
+        for pfx, uri in _PREFIX_MAP.items():
+            self.graph.bind(pfx, uri)
         self.graph.bind("lkd", self.namespace)
 
         self.nsm = NamespaceManager(self.graph)
 
+        # flat prefix to namespace map (including metadata file prefixes and
+        # lkd) for expanding CURIEs with a single dict lookup
+        self._prefix_map = {pfx: str(ns) for pfx, ns in self.graph.namespaces()}
+
+        # cache for from_n3 results; the same small set of CURIEs (recurring
+        # superclasses/-properties) repeats on most rows
+        self._n3_cache: dict[str, rdflib.term.Identifier] = {}
+
         # identifier for the LKD ontology
         lkdURIRef = URIRef(self.namespace)
 
-        curdate = datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+        curdate = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
-        if (lkdURIRef, DCTERMS.issued, None) not in self.graph and self.version:
+        if self.version and self.graph.value(lkdURIRef, DCTERMS.issued) is None:
             self.graph.add((lkdURIRef, DCTERMS.issued, Literal(curdate[:10], datatype=XSD.date)))
 
         if self.version:
@@ -128,7 +169,41 @@ class DataModelConverter:
         Returns:
             An rdflib identifier corresponding to the given n3 string
         """
-        return from_n3(s, nsm=self.nsm)
+        v = self._n3_cache.get(s)
+        if v is None:
+            v = self._n3_cache[s] = _from_n3_cached(s, self.nsm)
+        return v
+
+    def _split_curies(self, s: str):
+        """
+        Splits a comma-separated CURIE cell into resolved rdflib identifiers.
+
+        Parameters:
+            s (str): raw cell value (may be empty)
+
+        Returns:
+            A list of identifiers; empty for a blank cell
+        """
+        from_n3 = self.from_n3
+        return [from_n3(item) for tok in s.split(",") if (item := tok.strip())] if s else ()
+
+    def _expand_curie(self, item: str) -> str:
+        """
+        Expands a CURIE via the precomputed prefix map instead of the namespace manager.
+
+        Parameters:
+            item (str): a CURIE such as lkd:Work
+
+        Returns:
+            The expanded IRI as a string
+        """
+        pfx, _, local = item.partition(":")
+        base = self._prefix_map.get(pfx)
+        if base is None:
+            # unknown prefix; defer to the namespace manager so the strict
+            # error handling for bad CURIEs is preserved
+            return str(self.graph.namespace_manager.expand_curie(item))
+        return base + local
 
     def processComplexCol(self, s: URIRef, p: URIRef, o: str) -> None:
         """
@@ -149,14 +224,19 @@ class DataModelConverter:
             stripped = o[1:-1].strip()
             if "[" in stripped or "]" in stripped:
                 raise ValueError(f"There is no support for nested brackets! Got {s} {p} {o}")
-            # strip and drop empty values
-            union_items = [item for _ in stripped.split(",") if (item := _.strip(" {}"))]
-            if len(union_items) < 2:
+            # strip, drop empty values and expand to IRIs in a single pass
+            members = [URIRef(item if item.startswith("http") else self._expand_curie(item))
+                       for _ in stripped.split(",") if (item := _.strip(" {}"))]
+            if len(members) < 2:
                 raise ValueError(f"Expanded union had less than two elements in it! Got {s} {p} {o}")
-            expanded_items = [self.graph.namespace_manager.expand_curie(item) if not item.startswith("http") else item for item in union_items]
-            joined_items = "> <".join(expanded_items)
-            data_to_be_parsed = f"<{s}> <{p}> [ a <{OWL.Class}> ; <{OWL.unionOf}> ( <{joined_items}> ) ] ."
-            self.graph.parse(data=data_to_be_parsed)
+            # construct the union structure directly instead of serializing it
+            # to text and running it through the full n3 parser per cell
+            union_class = BNode()
+            self.graph.add((union_class, RDF.type, OWL.Class))
+            union_list = BNode()
+            Collection(self.graph, union_list, members)
+            self.graph.add((union_class, OWL.unionOf, union_list))
+            self.graph.add((s, p, union_class))
         else:
             # single value expected
             self.graph.add((s, p, self.from_n3(o)))
@@ -166,91 +246,148 @@ class DataModelConverter:
         Converts the CSV document and adds resulting triples to the conversion-specific graph.
         """
         LKD = rdflib.Namespace(self.namespace)
-        with open(self.input_path, "r", encoding="utf-8", newline="") as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter=",")
 
-            # initialize previous row variable
-            prevRow = dict((x, "") for x in csvreader.fieldnames)
+        # local aliases to avoid repeated global/attribute lookups in the row loop
+        EMPTY = EMPTY_COL_VALS
+        strip = str.strip
+        g = self.graph
+        graph_addN = g.addN
+        from_n3 = self.from_n3
+        Literal_ = Literal
+        processComplex = self.processComplexCol
+        split_curies = self._split_curies
+        map_preds = MAP_PREDS
+        # namespace terms used on every row; DefinedNamespace attribute
+        # access goes through a metaclass __getattr__ per lookup
+        RDFS_label = RDFS.label
+        RDFS_domain = RDFS.domain
+        RDFS_range = RDFS.range
+        RDFS_subClassOf = RDFS.subClassOf
+        RDFS_subPropertyOf = RDFS.subPropertyOf
+        RDFS_Resource = RDFS.Resource
+        RDFS_Literal = RDFS.Literal
+        RDF_type = RDF.type
+        OWL_Class = OWL.Class
+        OWL_ObjectProperty = OWL.ObjectProperty
+        OWL_DatatypeProperty = OWL.DatatypeProperty
+
+        # 1 MiB buffer keeps the read() syscall count low on large CSV inputs
+        with open(self.input_path, "r", encoding="utf-8", newline="", buffering=1 << 20) as csvfile:
+            # plain csv.reader with pre-resolved column indices avoids the
+            # per-row dict allocation and key hashing of csv.DictReader
+            csvreader = csv.reader(csvfile, delimiter=",")
+            header = next(csvreader)
+            col = {name: i for i, name in enumerate(header)}
+            id_i = col["lkd-id"]
+            hist_i = col["skos:historyNote"]
+            label_fi_i = col["lkd rdfs:label-fi"]
+            label_sv_i = col["lkd rdfs:label-sv"]
+            map_bf_i = col["mapping LKD to BF"]
+            bf_id_i = col["bibframe-id"]
+            map_rda_i = col["mapping LKD to RDA"]
+            rda_id_i = col["RDA-id"]
+            domain_i = col["lkd rdfs:domain"]
+            range_i = col["lkd rdfs:range"]
+            type_i = col["rdf:type"]
+            subclass_i = col["rdfs:subClassOf"]
+            subprop_i = col["rdfs:subPropertyOf"]
+
+            # (subject, predicate, raw value) triples already expanded; unlike a
+            # previous-row comparison this also suppresses non-consecutive
+            # duplicate rows for the same id
+            seen_dr = set()
+
+            # subjects that already have an rdfs:range (explicit or defaulted),
+            # replacing membership probes against the store
+            range_subjects = set()
 
             for row in csvreader:
+                # drop unwanted rows before normalising the whole row, so
+                # skipped rows only pay for stripping the gating cell
+                if strip(row[hist_i]) == "lkd-v0.1: not included":
+                    continue
+
                 # strip all column values before use and map special values to empty strings
-                row = dict((x, _) if (_ := y.strip()) not in EMPTY_COL_VALS else (x, "") for (x, y) in row.items())
+                row = ["" if (v := strip(y)) in EMPTY else v for y in row]
 
-                # drop unwanted rows
-                if row["skos:historyNote"] == "lkd-v0.1: not included":
-                    continue
+                # accumulate this row's triples and flush once via addN
+                triples = []
+                t_append = triples.append
 
-                id = row["lkd-id"]
+                id = row[id_i]
 
                 if not id.startswith("lkd:"):
                     raise ValueError("LKD-id is not within the lkd: namespace: " + id)
                 lkd_id = LKD[id[4:]]
 
-                # labels
-                self.graph.add((lkd_id, RDFS.label, Literal(row["lkd rdfs:label-fi"], "fi")))
-                self.graph.add((lkd_id, RDFS.label, Literal(row["lkd rdfs:label-sv"], "sv")))
+                # labels (blank cells would otherwise end up as empty literals)
+                if label_fi := row[label_fi_i]:
+                    t_append((lkd_id, RDFS_label, Literal_(label_fi, "fi"), g))
+                if label_sv := row[label_sv_i]:
+                    t_append((lkd_id, RDFS_label, Literal_(label_sv, "sv"), g))
 
                 # LKD to BF mapping
-                lkd_map_bf = row["mapping LKD to BF"]
-                if lkd_map_bf not in ["skos:exactMatch", "skos:closeMatch", "skos:broadMatch", "skos:narrowMatch"]:
+                lkd_map_bf = row[map_bf_i]
+                if lkd_map_bf not in ALLOWED_MAPS:
                     raise ValueError(f"Mapping property from {lkd_id} to BIBFRAME had an unexpected value, got: {lkd_map_bf}")
-                self.graph.add((lkd_id, self.from_n3(lkd_map_bf), URIRef(row["bibframe-id"])))
+                t_append((lkd_id, map_preds[lkd_map_bf], URIRef(row[bf_id_i]), g))
 
                 # LKD to RDA mapping
-                lkd_map_rda = row["mapping LKD to RDA"]
-                if lkd_map_rda not in ["skos:exactMatch", "skos:closeMatch", "skos:broadMatch", "skos:narrowMatch"]:
+                lkd_map_rda = row[map_rda_i]
+                if lkd_map_rda not in ALLOWED_MAPS:
                     if not lkd_map_rda in EMPTY_COL_VALS:
                         raise ValueError(f"Mapping property from {lkd_id} to RDA had an unexpected value, got: {lkd_map_bf}")
                     else:
                         # missing values may pass
                         pass
                 else:
-                    self.graph.add((lkd_id, self.from_n3(lkd_map_rda), URIRef(row["RDA-id"])))
+                    t_append((lkd_id, map_preds[lkd_map_rda], URIRef(row[rda_id_i]), g))
 
                 # domain
-                domainCol = "lkd rdfs:domain"
-                if (lkd_domain := row[domainCol]) and (id != prevRow["lkd-id"] or lkd_domain != prevRow[domainCol]):
-                    self.processComplexCol(lkd_id, RDFS.domain, lkd_domain)
+                if (lkd_domain := row[domain_i]) and (key := (lkd_id, RDFS_domain, lkd_domain)) not in seen_dr:
+                    seen_dr.add(key)
+                    processComplex(lkd_id, RDFS_domain, lkd_domain)
 
                 # range
-                rangeCol = "lkd rdfs:range"
-                if (lkd_range := row[rangeCol]) and (id != prevRow["lkd-id"] or lkd_range != prevRow[rangeCol]):
-                    self.processComplexCol(lkd_id, RDFS.range, lkd_range)
+                if lkd_range := row[range_i]:
+                    range_subjects.add(lkd_id)
+                    if (key := (lkd_id, RDFS_range, lkd_range)) not in seen_dr:
+                        seen_dr.add(key)
+                        processComplex(lkd_id, RDFS_range, lkd_range)
 
                 # type
-                lkd_type = row["rdf:type"]
+                lkd_type = row[type_i]
                 if lkd_type == "owl:Class":
-                    self.graph.add((lkd_id, RDF.type, OWL.Class))
+                    t_append((lkd_id, RDF_type, OWL_Class, g))
                 elif lkd_type == "owl:ObjectProperty":
-                    self.graph.add((lkd_id, RDF.type, OWL.ObjectProperty))
-                    if (lkd_id, RDFS.range, None) not in self.graph:
+                    t_append((lkd_id, RDF_type, OWL_ObjectProperty, g))
+                    if lkd_id not in range_subjects:
                         # set rdfs:range to rdfs:Resource in case no range specified (handled previously)
-                        self.graph.add((lkd_id, RDFS.range, RDFS.Resource))
+                        range_subjects.add(lkd_id)
+                        t_append((lkd_id, RDFS_range, RDFS_Resource, g))
                 elif lkd_type == "owl:DatatypeProperty":
-                    self.graph.add((lkd_id, RDF.type, OWL.DatatypeProperty))
-                    empty = True  # helper variable for checking out if rdfs:range is empty
-                    for range in self.graph.objects(lkd_id, RDFS.range):
-                        empty = False
-                        if range != RDFS.Literal:
+                    t_append((lkd_id, RDF_type, OWL_DatatypeProperty, g))
+                    if lkd_range:
+                        # validate the row's own range cell instead of scanning the
+                        # graph; union values are blank nodes, never rdfs:Literal
+                        if lkd_range.startswith("[") or from_n3(lkd_range) != RDFS_Literal:
                             raise ValueError(f"Property {lkd_id} has rdfs:range of {lkd_range} (expected rdfs:Literal due to rdf:type owl:DatatypeProperty)")
-                    if empty:
+                    elif lkd_id not in range_subjects:
                         # set rdfs:range to rdfs:Literal in case no range specified (handled previously)
-                        self.graph.add((lkd_id, RDFS.range, RDFS.Literal))
+                        range_subjects.add(lkd_id)
+                        t_append((lkd_id, RDFS_range, RDFS_Literal, g))
                 else:
                     raise ValueError(f"{lkd_id} had an unexpected type value, got {lkd_type}")
 
                 # subclasses
-                lkd_subclass = row["rdfs:subClassOf"]
-                for item in [_.strip() for _ in lkd_subclass.split(",") if lkd_subclass]:
-                    self.graph.add((lkd_id, RDFS.subClassOf, self.from_n3(item)))
+                for item in split_curies(row[subclass_i]):
+                    t_append((lkd_id, RDFS_subClassOf, item, g))
 
                 # subproperties
-                lkd_subproperty = row["rdfs:subPropertyOf"]
-                for item in [_.strip() for _ in lkd_subproperty.split(",") if lkd_subproperty]:
-                    self.graph.add((lkd_id, RDFS.subPropertyOf, self.from_n3(item)))
+                for item in split_curies(row[subprop_i]):
+                    t_append((lkd_id, RDFS_subPropertyOf, item, g))
 
-                # update the previous row variable for the next iteration
-                prevRow = row
+                graph_addN(triples)
 
     def serialize(self):
         """